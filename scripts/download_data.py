@@ -4,9 +4,9 @@
 from __future__ import annotations
 
 import hashlib
-import io
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Tuple
@@ -34,15 +34,13 @@ FALLBACK_URL = "https://raw.githubusercontent.com/plotly/datasets/master/heart.c
 UCI_SOURCE_URL = "https://archive.ics.uci.edu/ml/datasets/Heart+Disease"
 
 
-def _sha256sum(path: Path) -> str:
-    hasher = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+def _write_with_checksum(payload: bytes, path: Path) -> str:
+    """Write bytes to disk and return their sha256 without re-reading the file."""
+    path.write_bytes(payload)
+    return hashlib.sha256(payload).hexdigest()
 
 
-def _fetch_via_ucimlrepo() -> Tuple[pd.DataFrame, str, str]:
+def _fetch_via_ucimlrepo(raw_path: Path) -> Tuple[pd.DataFrame, str, str, str]:
     from ucimlrepo import fetch_ucirepo
 
     repo = fetch_ucirepo(id=UCI_DATASET_ID)
@@ -51,25 +49,32 @@ def _fetch_via_ucimlrepo() -> Tuple[pd.DataFrame, str, str]:
     df = pd.concat([features, targets], axis=1)
     if "target" not in df.columns and "num" in df.columns:
         df = df.rename(columns={"num": data_utils.TARGET_COLUMN})
-    return df, f"ucimlrepo id={UCI_DATASET_ID} (Heart Disease)", UCI_SOURCE_URL
-
-
-def _fetch_fallback() -> Tuple[pd.DataFrame, str, str]:
-    response = requests.get(FALLBACK_URL, timeout=30)
-    response.raise_for_status()
-    df = pd.read_csv(io.StringIO(response.text))
-    return df, "github:plotly-datasets heart.csv", FALLBACK_URL
+    checksum = _write_with_checksum(df.to_csv(index=False).encode(), raw_path)
+    return df, checksum, f"ucimlrepo id={UCI_DATASET_ID} (Heart Disease)", UCI_SOURCE_URL
 
 
-def _download_dataset() -> Tuple[pd.DataFrame, str, str]:
+def _fetch_fallback(raw_path: Path) -> Tuple[pd.DataFrame, str, str, str]:
+    """Stream the fallback CSV straight to disk, hashing each chunk as it is written."""
+    hasher = hashlib.sha256()
+    with requests.get(FALLBACK_URL, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        with raw_path.open("wb") as handle:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                hasher.update(chunk)
+                handle.write(chunk)
+    df = data_utils.read_table(raw_path)
+    return df, hasher.hexdigest(), "github:plotly-datasets heart.csv", FALLBACK_URL
+
+
+def _download_dataset(raw_path: Path) -> Tuple[pd.DataFrame, str, str, str]:
+    """Download the dataset to ``raw_path``; return (df, sha256, source, source_url)."""
     try:
-        df, source, source_url = _fetch_via_ucimlrepo()
+        result = _fetch_via_ucimlrepo(raw_path)
         print(f"Downloaded dataset via ucimlrepo (id={UCI_DATASET_ID}).")
-        return df, source, source_url
+        return result
     except Exception as exc:  # noqa: BLE001
         print(f"ucimlrepo download failed ({exc}); falling back to {FALLBACK_URL}")
-        df, source, source_url = _fetch_fallback()
-        return df, source, source_url
+        return _fetch_fallback(raw_path)
 
 
 def main() -> None:
@@ -77,21 +82,30 @@ def main() -> None:
     settings.processed_data_dir.mkdir(parents=True, exist_ok=True)
     settings.sample_data_path.parent.mkdir(parents=True, exist_ok=True)
 
-    raw_df, source, source_url = _download_dataset()
-
     raw_path = settings.raw_data_dir / "heart.csv"
-    raw_df.to_csv(raw_path, index=False)
-    checksum = _sha256sum(raw_path)
+    raw_df, checksum, source, source_url = _download_dataset(raw_path)
     print(f"Saved raw dataset to {raw_path} ({len(raw_df)} rows).")
 
     processed_df = data_utils.prepare_heart_dataframe(raw_df)
-    processed_path = settings.processed_data_dir / "heart_processed.csv"
-    processed_df.to_csv(processed_path, index=False)
-    print(f"Saved cleaned dataset to {processed_path} ({len(processed_df)} rows).")
-
+    processed_path = settings.processed_data_dir / data_utils.PROCESSED_FILENAME
     sample_rows = min(30, len(processed_df))
     sample_df = processed_df.sample(n=sample_rows, random_state=settings.random_seed)
-    sample_df.to_csv(settings.sample_data_path, index=False)
+
+    # Both writers spend their time in C (pyarrow / pandas IO), so overlap them.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        writes = [
+            pool.submit(
+                processed_df.to_parquet,
+                processed_path,
+                engine="pyarrow",
+                compression="zstd",
+                index=False,
+            ),
+            pool.submit(sample_df.to_csv, settings.sample_data_path, index=False),
+        ]
+        for write in writes:
+            write.result()
+    print(f"Saved cleaned dataset to {processed_path} ({len(processed_df)} rows).")
     print(f"Wrote sample dataset to {settings.sample_data_path} ({sample_rows} rows).")
 
     metadata = {
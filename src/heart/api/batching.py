@@ -0,0 +1,92 @@
+"""Asyncio micro-batching for model inference."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+class MicroBatcher:
+    """
+    Collect concurrent submissions into batches handled by a single worker.
+
+    The worker waits for the first item, then keeps draining the queue until
+    ``max_batch_size`` items are collected or ``max_wait_seconds`` elapse. The
+    batch handler runs in the default executor so the event loop stays free;
+    batches are processed one at a time, so the handler may reuse buffers.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Sequence[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.002,
+    ) -> None:
+        self._handler = handler
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_seconds = max(0.0, float(max_wait_seconds))
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Start the worker on the running loop (restarting it if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the worker task if it belongs to the running loop."""
+        task, self._task = self._task, None
+        if task is None or task.done() or self._loop is not asyncio.get_running_loop():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result (or re-raise the batch error)."""
+        self.start()
+        future = self._loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+            try:
+                results = await self._loop.run_in_executor(None, self._handler, items)
+                if len(results) != len(items):
+                    raise RuntimeError(f"Batch handler returned {len(results)} results for {len(items)} items")
+            except Exception as exc:  # noqa: BLE001
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -2,39 +2,58 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timezone
+import time
 from sys import stdout
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+import orjson
+
+# Optional structured fields copied from `extra=` onto the JSON payload.
+EXTRA_FIELDS: Tuple[str, ...] = (
+    "request_id",
+    "path",
+    "method",
+    "status_code",
+    "duration_ms",
+    "model_version",
+    "run_id",
+    "source",
+)
 
 
 class JsonFormatter(logging.Formatter):
     """Format log records as single-line JSON for easier scraping."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, ISO prefix) so strftime runs at most once per second.
+        self._ts_cache: Tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        seconds = int(created)
+        cached = self._ts_cache
+        if cached[0] != seconds:
+            cached = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)))
+            self._ts_cache = cached
+        micros = int((created - seconds) * 1_000_000)
+        return f"{cached[1]}.{micros:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401
         payload: Dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
-        for key in (
-            "request_id",
-            "path",
-            "method",
-            "status_code",
-            "duration_ms",
-            "model_version",
-            "run_id",
-            "source",
-        ):
-            value = getattr(record, key, None)
+        attrs = vars(record)
+        for key in EXTRA_FIELDS:
+            value = attrs.get(key)
             if value is not None:
                 payload[key] = value
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=True)
+        return orjson.dumps(payload, default=str).decode()
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
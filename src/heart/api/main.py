@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from secrets import token_hex
 from time import perf_counter
-from typing import Optional, Tuple
-from uuid import uuid4
+from typing import List, Optional, Sequence, Tuple
 
+import joblib
 import mlflow
 import mlflow.sklearn
+import numpy as np
+import orjson
 import pandas as pd
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 
 from ..config import settings
+from ..data import FEATURE_COLUMNS
+from ..mlflow_utils import JOBLIB_MODEL_FILENAME
 from . import metrics
+from .batching import MicroBatcher
 from .logging import setup_logging
 from .schema import HealthResponse, PredictionRequest, PredictionResponse
 
@@ -28,6 +35,7 @@ app = FastAPI(
     title="Heart Disease API",
     version="0.1.0",
     description="Serves the MLflow-exported heart disease classifier.",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -43,14 +51,29 @@ class ModelState:
 
 model_state = ModelState()
 
+# Reads every request feature in FEATURE_COLUMNS order with one C-level call (no model_dump dict).
+_feature_values = attrgetter(*FEATURE_COLUMNS)
+
+# Scratch rows reused across batches; only the batch worker writes here, one batch at a time.
+_batch_buffer = np.empty((settings.predict_batch_max_size, len(FEATURE_COLUMNS)), dtype=np.float32)
+
+
+@lru_cache(maxsize=4)
+def _parse_metadata(path: str, mtime_ns: int) -> dict:
+    """Parse metadata json; keyed on mtime so a rewritten file is parsed again."""
+    return orjson.loads(Path(path).read_bytes())
+
 
 def _read_metadata(model_dir: Path) -> dict:
     """Read model metadata json if present."""
     meta_path = model_dir / "metadata.json"
-    if not meta_path.exists():
+    try:
+        mtime_ns = meta_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
     try:
-        return json.loads(meta_path.read_text())
+        # Copy so callers cannot mutate the cached dict.
+        return dict(_parse_metadata(str(meta_path), mtime_ns))
     except Exception as exc:  # noqa: BLE001
         logger.warning("Failed to parse %s: %s", meta_path, exc)
         return {}
@@ -71,13 +94,18 @@ def _load_model() -> None:
 
     try:
         mlflow.set_tracking_uri(settings.mlflow_tracking_uri)
-        pyfunc_model = mlflow.pyfunc.load_model(str(MODEL_PATH))
-        try:
+        info = mlflow.models.get_model_info(str(MODEL_PATH))
+        # Prefer the raw sklearn estimator: one deserialization, no pyfunc schema enforcement per call.
+        has_sklearn_flavor = "sklearn" in (info.flavors or {})
+        joblib_path = MODEL_PATH / JOBLIB_MODEL_FILENAME
+        if has_sklearn_flavor and joblib_path.exists():
+            # Read-only memory map: estimator arrays are shared page-cache pages across workers.
+            inference_model = joblib.load(joblib_path, mmap_mode="r")
+        elif has_sklearn_flavor:
             inference_model = mlflow.sklearn.load_model(str(MODEL_PATH))
-        except Exception:  # noqa: BLE001
-            inference_model = pyfunc_model
+        else:
+            inference_model = mlflow.pyfunc.load_model(str(MODEL_PATH))
 
-        info = mlflow.models.get_model_info(str(MODEL_PATH))
         meta = _read_metadata(MODEL_PATH)
 
         _set_model_state(
@@ -99,34 +127,69 @@ def _load_model() -> None:
         _set_model_state()
 
 
-def _predict_with_probability(model, df: pd.DataFrame) -> Tuple[int, float]:
-    """Return (prediction, probability) with safe fallbacks."""
-    raw_pred = model.predict(df)
-    try:
-        pred_value = raw_pred[0]
-    except Exception:  # noqa: BLE001
-        pred_value = raw_pred
-    pred_int = int(pred_value)
+def _feature_frame(payloads: Sequence[PredictionRequest]) -> pd.DataFrame:
+    """Write request features into the reusable float32 buffer and wrap it without copying."""
+    rows = _batch_buffer[: len(payloads)]
+    # One slice store converts the whole batch of attribute tuples in C.
+    rows[:] = list(map(_feature_values, payloads))
+    # The sklearn pipeline selects columns by name, so it still needs a DataFrame.
+    return pd.DataFrame(rows, columns=FEATURE_COLUMNS, copy=False)
+
 
-    probability: float
+def _predict_with_probability(model, df: pd.DataFrame) -> List[Tuple[int, float]]:
+    """Return (prediction, probability) per row from a single predict_proba call."""
     try:
-        proba = model.predict_proba(df)
-        probability = float(proba[0][-1])
+        proba = np.asarray(model.predict_proba(df))
     except Exception:  # noqa: BLE001
-        probability = float(pred_int)
-    return pred_int, probability
+        # Models without predict_proba (e.g. some pyfunc flavors) only expose labels.
+        preds = [int(value) for value in np.asarray(model.predict(df)).reshape(-1)]
+        return [(pred, float(pred)) for pred in preds]
+
+    # sklearn's predict is classes_[argmax(predict_proba)], so derive labels the same way.
+    labels = np.argmax(proba, axis=1)
+    classes = getattr(model, "classes_", None)
+    if classes is not None:
+        labels = np.asarray(classes)[labels]
+    return [(int(label), float(prob)) for label, prob in zip(labels, proba[:, -1])]
+
+
+def _predict_batch(payloads: Sequence[PredictionRequest]) -> List[Tuple[int, float]]:
+    """Score a micro-batch of requests with a single model call."""
+    model = model_state.model
+    if model is None:
+        raise RuntimeError("Model not loaded")
+    return _predict_with_probability(model, _feature_frame(payloads))
+
+
+batcher = MicroBatcher(
+    _predict_batch,
+    max_batch_size=settings.predict_batch_max_size,
+    max_wait_seconds=settings.predict_batch_max_wait_ms / 1000,
+)
 
 
 @app.on_event("startup")
 async def _ensure_model_loaded() -> None:
     if model_state.model is None:
         _load_model()
+    batcher.start()
+
+
+@app.on_event("shutdown")
+async def _stop_batcher() -> None:
+    await batcher.stop()
 
 
 @app.middleware("http")
 async def add_metrics_and_logging(request: Request, call_next):
     """Record Prometheus metrics and structured logs with request ids."""
-    request_id = request.headers.get("X-Request-ID", str(uuid4()))
+    path = request.url.path
+    if not metrics.should_track_path(path):
+        # Excluded paths (e.g. /metrics scrapes) skip request ids, timing and logging entirely.
+        return await call_next(request)
+
+    # Only mint an id when the caller did not send one; 64 random bits is plenty per host.
+    request_id = request.headers.get("X-Request-ID") or token_hex(8)
     start = perf_counter()
     status_code = 500
 
@@ -136,19 +199,18 @@ async def add_metrics_and_logging(request: Request, call_next):
     except Exception as exc:  # noqa: BLE001
         status_code = getattr(exc, "status_code", 500) if hasattr(exc, "status_code") else 500
         elapsed = perf_counter() - start
-        if metrics.should_track_path(request.url.path):
-            metrics.record_error(endpoint=request.url.path, method=request.method)
-            metrics.record_request(
-                endpoint=request.url.path,
-                method=request.method,
-                status_code=status_code,
-                elapsed_seconds=elapsed,
-            )
+        metrics.record_error(endpoint=path, method=request.method)
+        metrics.record_request(
+            endpoint=path,
+            method=request.method,
+            status_code=status_code,
+            elapsed_seconds=elapsed,
+        )
         logger.exception(
             "request-error",
             extra={
                 "request_id": request_id,
-                "path": request.url.path,
+                "path": path,
                 "method": request.method,
                 "status_code": status_code,
                 "duration_ms": round(elapsed * 1000, 2),
@@ -159,18 +221,17 @@ async def add_metrics_and_logging(request: Request, call_next):
         raise
     else:
         elapsed = perf_counter() - start
-        if metrics.should_track_path(request.url.path):
-            metrics.record_request(
-                endpoint=request.url.path,
-                method=request.method,
-                status_code=status_code,
-                elapsed_seconds=elapsed,
-            )
+        metrics.record_request(
+            endpoint=path,
+            method=request.method,
+            status_code=status_code,
+            elapsed_seconds=elapsed,
+        )
         logger.info(
             "request-complete",
             extra={
                 "request_id": request_id,
-                "path": request.url.path,
+                "path": path,
                 "method": request.method,
                 "status_code": status_code,
                 "duration_ms": round(elapsed * 1000, 2),
@@ -194,14 +255,13 @@ def health() -> HealthResponse:
 
 
 @app.post("/predict", response_model=PredictionResponse)
-def predict(payload: PredictionRequest) -> PredictionResponse:
-    """Generate a prediction with the loaded model."""
+async def predict(payload: PredictionRequest) -> PredictionResponse:
+    """Generate a prediction with the loaded model (micro-batched with concurrent requests)."""
     if model_state.model is None:
         raise HTTPException(status_code=503, detail="Model not loaded. Run `make train` then restart the API.")
 
     try:
-        df = pd.DataFrame([payload.model_dump()])
-        pred, prob = _predict_with_probability(model_state.model, df)
+        pred, prob = await batcher.submit(payload)
     except HTTPException:
         raise
     except Exception as exc:  # noqa: BLE001
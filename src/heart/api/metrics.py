@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+from functools import lru_cache
+from time import monotonic
+
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
 REQUEST_COUNT = Counter(
@@ -23,25 +27,59 @@ ERROR_COUNT = Counter(
 )
 
 # Endpoints like /metrics can be noisy or recursive; opt-out if needed.
-EXCLUDED_PATH_PREFIXES = {"/metrics"}
+# A tuple lets str.startswith test every prefix in a single C-level call.
+EXCLUDED_PATH_PREFIXES = ("/metrics",)
+
+
+# Labelled children are memoized so the hot path skips labels()' dict lookup + lock.
+@lru_cache(maxsize=256)
+def _request_counter(endpoint: str, method: str, status_code: int):
+    return REQUEST_COUNT.labels(endpoint=endpoint, method=method, http_status=status_code)
+
+
+@lru_cache(maxsize=256)
+def _request_latency(endpoint: str, method: str):
+    return REQUEST_LATENCY.labels(endpoint=endpoint, method=method)
+
+
+@lru_cache(maxsize=256)
+def _error_counter(endpoint: str, method: str):
+    return ERROR_COUNT.labels(endpoint=endpoint, method=method)
 
 
 def record_request(endpoint: str, method: str, status_code: int, elapsed_seconds: float) -> None:
     """Record request count and latency."""
-    REQUEST_COUNT.labels(endpoint=endpoint, method=method, http_status=status_code).inc()
-    REQUEST_LATENCY.labels(endpoint=endpoint, method=method).observe(elapsed_seconds)
+    _request_counter(endpoint, method, status_code).inc()
+    _request_latency(endpoint, method).observe(elapsed_seconds)
 
 
 def record_error(endpoint: str, method: str) -> None:
     """Record an error."""
-    ERROR_COUNT.labels(endpoint=endpoint, method=method).inc()
+    _error_counter(endpoint, method).inc()
+
+
+# Rendered scrape bodies are reused for a short window, well inside any scrape interval.
+SCRAPE_CACHE_TTL_SECONDS = 0.25
+_scrape_cache = (float("-inf"), b"")
+_scrape_lock = threading.Lock()
 
 
 def prometheus_response():
-    """Return metrics body and content type."""
-    return generate_latest(), CONTENT_TYPE_LATEST
+    """Return metrics body and content type (cached for SCRAPE_CACHE_TTL_SECONDS)."""
+    global _scrape_cache
+    rendered_at, body = _scrape_cache
+    if monotonic() - rendered_at < SCRAPE_CACHE_TTL_SECONDS:
+        return body, CONTENT_TYPE_LATEST
+    with _scrape_lock:
+        # Another scrape may have refreshed the cache while we waited on the lock.
+        rendered_at, body = _scrape_cache
+        now = monotonic()
+        if now - rendered_at >= SCRAPE_CACHE_TTL_SECONDS:
+            body = generate_latest()
+            _scrape_cache = (now, body)
+    return body, CONTENT_TYPE_LATEST
 
 
 def should_track_path(path: str) -> bool:
     """Return True if the given path should be tracked."""
-    return not any(path.startswith(prefix) for prefix in EXCLUDED_PATH_PREFIXES)
+    return not path.startswith(EXCLUDED_PATH_PREFIXES)
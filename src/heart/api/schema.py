@@ -21,19 +21,22 @@ class HealthResponse(APIModel):
 
 
 class PredictionRequest(APIModel):
-    age: float = Field(..., example=54)
-    sex: int = Field(..., example=1, description="1=male, 0=female")
-    cp: int = Field(..., example=0, description="Chest pain type")
-    trestbps: float = Field(..., example=130)
-    chol: float = Field(..., example=246)
-    fbs: int = Field(..., example=0)
-    restecg: int = Field(..., example=1)
-    thalach: float = Field(..., example=150)
-    exang: int = Field(..., example=0)
-    oldpeak: float = Field(..., example=1.2)
-    slope: int = Field(..., example=2)
-    ca: int = Field(..., example=0)
-    thal: int = Field(..., example=2)
+    # Reject unknown fields instead of validating and discarding them; payloads are read-only.
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    age: float = Field(..., json_schema_extra={"example": 54})
+    sex: int = Field(..., json_schema_extra={"example": 1}, description="1=male, 0=female")
+    cp: int = Field(..., json_schema_extra={"example": 0}, description="Chest pain type")
+    trestbps: float = Field(..., json_schema_extra={"example": 130})
+    chol: float = Field(..., json_schema_extra={"example": 246})
+    fbs: int = Field(..., json_schema_extra={"example": 0})
+    restecg: int = Field(..., json_schema_extra={"example": 1})
+    thalach: float = Field(..., json_schema_extra={"example": 150})
+    exang: int = Field(..., json_schema_extra={"example": 0})
+    oldpeak: float = Field(..., json_schema_extra={"example": 1.2})
+    slope: int = Field(..., json_schema_extra={"example": 2})
+    ca: int = Field(..., json_schema_extra={"example": 0})
+    thal: int = Field(..., json_schema_extra={"example": 2})
 
 
 class PredictionResponse(APIModel):
@@ -25,5 +25,8 @@ class Settings(BaseSettings):
     plots_dir: Path = Path("artifacts/plots")
     mlflow_tracking_uri: str = "file:./mlruns"
 
+    predict_batch_max_size: int = 32
+    predict_batch_max_wait_ms: float = 2.0
+
 
 settings = Settings()
@@ -5,7 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pacsv
 from sklearn.model_selection import train_test_split
 
 from .config import settings
@@ -28,6 +30,13 @@ FEATURE_COLUMNS = [
     "ca",
     "thal",
 ]
+PREPARED_COLUMNS = FEATURE_COLUMNS + [TARGET_COLUMN]
+# Compact dtypes: categorical codes fit in int8, continuous features keep enough precision in float32.
+FEATURE_DTYPES = {col: ("int8" if col in CATEGORICAL_FEATURES else "float32") for col in FEATURE_COLUMNS}
+PROCESSED_FILENAME = "heart_processed.parquet"
+LEGACY_PROCESSED_FILENAME = "heart_processed.csv"
+# UCI exports mark missing values with "?"; keep PyArrow's default null markers too.
+CSV_NULL_VALUES = [*pacsv.ConvertOptions().null_values, "?"]
 
 
 def _standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -47,19 +56,36 @@ def validate_schema(df: pd.DataFrame) -> None:
         raise ValueError(f"Dataset missing required columns: {sorted(missing)}")
 
 
+def _to_float_matrix(df: pd.DataFrame) -> np.ndarray:
+    """Coerce every column into one float64 matrix; unparseable values become NaN."""
+    try:
+        return df.to_numpy(dtype=np.float64, na_value=np.nan)
+    except (TypeError, ValueError):
+        coerced = df.apply(pd.to_numeric, errors="coerce")
+        return coerced.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
 def prepare_heart_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and align the heart disease dataframe."""
     prepared = _standardize_columns(df)
-    prepared = prepared.replace("?", pd.NA)
     validate_schema(prepared)
-    prepared = prepared[FEATURE_COLUMNS + [TARGET_COLUMN]].copy()
+    # Placeholders such as "?" fail the fast float conversion and are coerced to NaN.
+    values = _to_float_matrix(prepared[PREPARED_COLUMNS])
+    values = values[~np.isnan(values).any(axis=1)]
+
+    columns = {
+        col: values[:, idx].astype(FEATURE_DTYPES[col]) for idx, col in enumerate(FEATURE_COLUMNS)
+    }
+    columns[TARGET_COLUMN] = (values[:, -1] > 0).astype("int8")
+    return pd.DataFrame(columns)
 
-    for col in FEATURE_COLUMNS + [TARGET_COLUMN]:
-        prepared[col] = pd.to_numeric(prepared[col], errors="coerce")
 
-    prepared = prepared.dropna().reset_index(drop=True)
-    prepared[TARGET_COLUMN] = (prepared[TARGET_COLUMN] > 0).astype(int)
-    return prepared
+def read_table(path: Path) -> pd.DataFrame:
+    """Read a Parquet or CSV table with PyArrow, dispatching on the file suffix."""
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    convert_options = pacsv.ConvertOptions(null_values=CSV_NULL_VALUES)
+    return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
 
 
 def load_sample(path: Optional[Path] = None) -> pd.DataFrame:
@@ -67,7 +93,7 @@ def load_sample(path: Optional[Path] = None) -> pd.DataFrame:
     sample_path = Path(path) if path else settings.sample_data_path
     if not sample_path.exists():
         raise FileNotFoundError(f"Sample dataset not found at {sample_path}")
-    df = pd.read_csv(sample_path)
+    df = read_table(sample_path)
     return prepare_heart_dataframe(df)
 
 
@@ -78,18 +104,24 @@ def load_raw(path: Optional[Path] = None) -> pd.DataFrame:
         raise FileNotFoundError(
             f"Raw data not found at {data_path}. Run `make data` to download it."
         )
-    df = pd.read_csv(data_path)
+    df = read_table(data_path)
     return _standardize_columns(df)
 
 
 def load_processed(path: Optional[Path] = None) -> pd.DataFrame:
     """Load the cleaned/processed dataset."""
-    data_path = Path(path) if path else settings.processed_data_dir / "heart_processed.csv"
+    if path:
+        data_path = Path(path)
+    else:
+        data_path = settings.processed_data_dir / PROCESSED_FILENAME
+        legacy_path = settings.processed_data_dir / LEGACY_PROCESSED_FILENAME
+        if not data_path.exists() and legacy_path.exists():
+            data_path = legacy_path
     if not data_path.exists():
         raise FileNotFoundError(
             f"Processed data not found at {data_path}. Run `make data` to prepare it."
         )
-    df = pd.read_csv(data_path)
+    df = read_table(data_path)
     return prepare_heart_dataframe(df)
 
 
@@ -2,34 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
-from sklearn.metrics import (
-    accuracy_score,
-    confusion_matrix,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-    roc_curve,
-)
+from sklearn.metrics import auc, roc_auc_score, roc_curve
 
 # Use headless backend for CI/servers
 matplotlib.use("Agg")
 
+# Pillow PNG options shared by every savefig: zlib level 3 encodes these small charts
+# noticeably faster than the default level 6 for a slightly larger file.
+PNG_KWARGS = {"compress_level": 3, "optimize": False}
+
+
+def _confusion_counts(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """Return the binary confusion matrix [[tn, fp], [fn, tp]] from boolean reductions."""
+    actual = np.asarray(y_true).astype(bool)
+    predicted = np.asarray(y_pred).astype(bool)
+    tp = int(np.count_nonzero(actual & predicted))
+    fp = int(np.count_nonzero(predicted)) - tp
+    fn = int(np.count_nonzero(actual)) - tp
+    tn = actual.size - tp - fp - fn
+    return np.array([[tn, fp], [fn, tp]])
+
 
 def compute_classification_metrics(
-    y_true: np.ndarray, y_pred: np.ndarray, y_proba: np.ndarray
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_proba: np.ndarray,
+    cm: Optional[np.ndarray] = None,
+    roc: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> Dict[str, float]:
-    """Compute standard binary classification metrics."""
+    """
+    Compute standard binary classification metrics.
+
+    ``cm`` (confusion matrix) and ``roc`` (fpr, tpr) may be passed in when the
+    caller already computed them, so they are not derived twice.
+    """
+    if cm is None:
+        cm = _confusion_counts(y_true, y_pred)
+    (tn, fp), (fn, tp) = cm
+    total = tn + fp + fn + tp
     metrics = {
-        "accuracy": accuracy_score(y_true, y_pred),
-        "precision": precision_score(y_true, y_pred, zero_division=0),
-        "recall": recall_score(y_true, y_pred, zero_division=0),
+        "accuracy": float((tp + tn) / total) if total else 0.0,
+        "precision": float(tp / (tp + fp)) if tp + fp else 0.0,
+        "recall": float(tp / (tp + fn)) if tp + fn else 0.0,
     }
+    if roc is not None:
+        # Same trapezoidal area roc_auc_score computes; undefined with a single class.
+        single_class = np.unique(np.asarray(y_true)).size < 2
+        metrics["roc_auc"] = 0.5 if single_class else float(auc(*roc))
+        return metrics
     try:
         metrics["roc_auc"] = roc_auc_score(y_true, y_proba)
     except ValueError:
@@ -37,20 +63,34 @@ def compute_classification_metrics(
     return metrics
 
 
-def plot_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray):
+def plot_confusion_matrix(
+    y_true: Optional[np.ndarray] = None,
+    y_pred: Optional[np.ndarray] = None,
+    *,
+    cm: Optional[np.ndarray] = None,
+):
     """Return a matplotlib figure with the confusion matrix heatmap."""
-    cm = confusion_matrix(y_true, y_pred)
+    if cm is None:
+        cm = _confusion_counts(y_true, y_pred)
     fig, ax = plt.subplots(figsize=(4, 3))
     sns.heatmap(cm, annot=True, fmt="d", cmap="Blues", cbar=False, ax=ax)
     ax.set_xlabel("Predicted")
     ax.set_ylabel("Actual")
     ax.set_title("Confusion Matrix")
+    fig.tight_layout()
     return fig
 
 
-def plot_roc_curve(y_true: np.ndarray, y_proba: np.ndarray):
+def plot_roc_curve(
+    y_true: Optional[np.ndarray] = None,
+    y_proba: Optional[np.ndarray] = None,
+    *,
+    fpr: Optional[np.ndarray] = None,
+    tpr: Optional[np.ndarray] = None,
+):
     """Return a matplotlib figure with the ROC curve."""
-    fpr, tpr, _ = roc_curve(y_true, y_proba)
+    if fpr is None or tpr is None:
+        fpr, tpr, _ = roc_curve(y_true, y_proba)
     fig, ax = plt.subplots(figsize=(4, 3))
     ax.plot(fpr, tpr, label="ROC curve")
     ax.plot([0, 1], [0, 1], linestyle="--", color="gray", label="Chance")
@@ -59,6 +99,7 @@ def plot_roc_curve(y_true: np.ndarray, y_proba: np.ndarray):
     ax.set_title("ROC Curve")
     ax.legend()
     ax.grid(True, linestyle="--", alpha=0.4)
+    fig.tight_layout()
     return fig
 
 
@@ -70,9 +111,11 @@ def evaluate_predictions(
 
     Returns a tuple of (metrics_dict, figures_dict).
     """
-    metrics = compute_classification_metrics(y_true, y_pred, y_proba)
+    cm = _confusion_counts(y_true, y_pred)
+    fpr, tpr, _ = roc_curve(y_true, y_proba)
+    metrics = compute_classification_metrics(y_true, y_pred, y_proba, cm=cm, roc=(fpr, tpr))
     figures = {
-        "confusion_matrix": plot_confusion_matrix(y_true, y_pred),
-        "roc_curve": plot_roc_curve(y_true, y_proba),
+        "confusion_matrix": plot_confusion_matrix(cm=cm),
+        "roc_curve": plot_roc_curve(fpr=fpr, tpr=tpr),
     }
     return metrics, figures
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
+import numpy as np
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
@@ -17,31 +18,44 @@ def build_preprocessor() -> ColumnTransformer:
     numeric_transformer = Pipeline(
         steps=[
             ("imputer", SimpleImputer(strategy="median")),
-            ("scaler", StandardScaler()),
+            # The imputer already returns a fresh array, so scale it in place.
+            ("scaler", StandardScaler(copy=False)),
         ]
     )
     categorical_transformer = Pipeline(
         steps=[
             ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("encoder", OneHotEncoder(handle_unknown="ignore", sparse_output=False)),
+            (
+                "encoder",
+                OneHotEncoder(handle_unknown="ignore", sparse_output=True, dtype=np.float32),
+            ),
         ]
     )
     preprocessor = ColumnTransformer(
         transformers=[
             ("num", numeric_transformer, NUMERIC_FEATURES),
             ("cat", categorical_transformer, CATEGORICAL_FEATURES),
-        ]
+        ],
+        # The one-hot block is built as CSR; the stacked output stays CSR only when it is
+        # mostly zeros. On the heart data it is ~50% dense, where dense arrays fit faster.
+        sparse_threshold=0.3,
     )
     return preprocessor
 
 
-def build_model_pipeline(estimator) -> Pipeline:
-    """Attach preprocessing to a downstream estimator."""
+def build_model_pipeline(estimator, memory=None) -> Pipeline:
+    """
+    Attach preprocessing to a downstream estimator.
+
+    ``memory`` (a ``joblib.Memory`` or cache directory) caches the fitted
+    preprocessor, so grid-search candidates sharing a fold reuse it.
+    """
     return Pipeline(
         steps=[
             ("preprocess", build_preprocessor()),
             ("model", estimator),
-        ]
+        ],
+        memory=memory,
     )
 
 
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import os
 import shutil
+import time
 from pathlib import Path
-from typing import Dict, Mapping
+from typing import Iterable, Mapping, Optional
 
+import joblib
 import mlflow
 import mlflow.sklearn
+import orjson
+from mlflow.entities import Metric, Param
+from mlflow.tracking import MlflowClient
 
 from .config import settings
 
+# Uncompressed joblib copy of the exported estimator so the API can memory-map its arrays.
+JOBLIB_MODEL_FILENAME = "model.joblib"
+
 
 def configure_mlflow() -> None:
     """Configure MLflow tracking URI and experiment."""
@@ -26,36 +34,64 @@ def start_run(run_name: str):
 
 
 def log_params_and_metrics(params: Mapping[str, object], metrics: Mapping[str, float]) -> None:
-    """Log params and metrics if provided."""
-    if params:
-        mlflow.log_params(params)
-    if metrics:
-        mlflow.log_metrics(metrics)
+    """Log params and metrics to the active run in a single ``log_batch`` call."""
+    if not params and not metrics:
+        return
+    timestamp = int(time.time() * 1000)
+    MlflowClient().log_batch(
+        run_id=mlflow.active_run().info.run_id,
+        metrics=[Metric(key, float(value), timestamp, 0) for key, value in (metrics or {}).items()],
+        params=[Param(key, str(value)) for key, value in (params or {}).items()],
+    )
+
+
+def log_image_files(paths: Iterable[Path], run_id: Optional[str] = None) -> None:
+    """
+    Log already-rendered image files as MLflow artifacts.
+
+    Uploading the PNGs written for local inspection avoids ``mlflow.log_figure``
+    rendering every figure a second time. Without ``run_id`` the active run is used.
+    """
+    client = MlflowClient() if run_id else None
+    for path in paths:
+        if client is None:
+            mlflow.log_artifact(str(path))
+        else:
+            client.log_artifact(run_id, str(path))
 
 
-def log_figures(figures: Dict[str, object], prefix: str = "") -> None:
-    """Log matplotlib figures as MLflow artifacts."""
-    for name, fig in figures.items():
-        filename = f"{prefix}{name}.png" if prefix else f"{name}.png"
-        mlflow.log_figure(fig, filename)
+def _sibling(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
 
 
 def export_model(model, run_id: str, model_name: str) -> Path:
     """
     Persist the trained model in MLflow format to the configured artifacts directory.
 
+    The export is written to a sibling staging directory and swapped in with
+    ``os.replace``, so readers never see a half-written model directory.
     Returns the path where the model was saved.
     """
     target_path = Path(settings.model_dir)
-    if target_path.exists():
-        shutil.rmtree(target_path)
+    staging_path = _sibling(target_path, ".new")
+    previous_path = _sibling(target_path, ".old")
+    # Leftovers from an interrupted export.
+    shutil.rmtree(staging_path, ignore_errors=True)
+    shutil.rmtree(previous_path, ignore_errors=True)
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    mlflow.sklearn.save_model(model, path=target_path)
+
+    mlflow.sklearn.save_model(model, path=staging_path)
+    joblib.dump(model, staging_path / JOBLIB_MODEL_FILENAME)
     metadata = {
         "run_id": run_id,
         "model_name": model_name,
         "artifact_path": str(target_path),
     }
-    meta_path = target_path / "metadata.json"
-    meta_path.write_text(json.dumps(metadata, indent=2))
+    meta_path = staging_path / "metadata.json"
+    meta_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+
+    if target_path.exists():
+        os.replace(target_path, previous_path)
+    os.replace(staging_path, target_path)
+    shutil.rmtree(previous_path, ignore_errors=True)
     return target_path
@@ -3,22 +3,32 @@
 from __future__ import annotations
 
 import argparse
-import json
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import matplotlib
+import matplotlib.pyplot as plt
 import mlflow
+import numpy as np
+import orjson
+from joblib import Memory
 from sklearn.dummy import DummyClassifier
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
 from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import GridSearchCV, StratifiedKFold
+from sklearn.model_selection import HalvingGridSearchCV, StratifiedKFold
 
 from .config import settings
 from .data import FEATURE_COLUMNS, load_processed, load_sample, train_test_split_data
-from .evaluate import evaluate_predictions
+from .evaluate import PNG_KWARGS, evaluate_predictions
 from .features import build_model_pipeline
-from .mlflow_utils import export_model, log_figures, log_params_and_metrics, start_run
+from .mlflow_utils import export_model, log_image_files, log_params_and_metrics, start_run
+
+# Use headless backend for CI/servers
+matplotlib.use("Agg")
 
 
 @dataclass
@@ -43,6 +53,11 @@ def parse_args() -> argparse.Namespace:
         default=0.2,
         help="Test split size for hold-out evaluation (default: 0.2).",
     )
+    parser.add_argument(
+        "--singlecore",
+        action="store_true",
+        help="Render plots in-process instead of a background worker process (for debugging).",
+    )
     return parser.parse_args()
 
 
@@ -94,16 +109,35 @@ def model_search_spaces(quick: bool) -> List[ModelSpec]:
     ]
 
 
-def save_figures_locally(figures: Dict[str, object], prefix: str) -> Dict[str, Path]:
-    """Persist plots to the artifacts/plots directory for quick inspection."""
+def _render_png(figure_bytes: bytes, path: str) -> str:
+    """Unpickle a figure and write it as PNG (runs in the render worker process)."""
+    fig = pickle.loads(figure_bytes)
+    fig.savefig(path, pil_kwargs=PNG_KWARGS)
+    plt.close(fig)
+    return path
+
+
+def save_figures_locally(
+    figures: Dict[str, object], prefix: str, pool: Optional[Executor] = None
+) -> Tuple[Dict[str, Path], List[Future]]:
+    """
+    Persist plots to the artifacts/plots directory for quick inspection.
+
+    With a ``pool``, figures are pickled and encoded in the worker; the returned
+    futures must be resolved before the files are relied upon.
+    """
     saved_paths: Dict[str, Path] = {}
+    pending: List[Future] = []
     settings.plots_dir.mkdir(parents=True, exist_ok=True)
     for name, fig in figures.items():
         path = settings.plots_dir / f"{prefix}_{name}.png"
-        fig.savefig(path, bbox_inches="tight")
+        if pool is None:
+            fig.savefig(path, pil_kwargs=PNG_KWARGS)
+        else:
+            pending.append(pool.submit(_render_png, pickle.dumps(fig), str(path)))
         saved_paths[name] = path
         fig.clf()
-    return saved_paths
+    return saved_paths, pending
 
 
 def train_single_model(
@@ -112,25 +146,36 @@ def train_single_model(
     y_train,
     X_test,
     y_test,
-    cv: StratifiedKFold,
+    cv: Sequence[Tuple[np.ndarray, np.ndarray]],
     data_source: str,
     quick: bool,
+    render_pool: Optional[Executor] = None,
+    memory: Optional[Memory] = None,
 ) -> Dict[str, object]:
     """Fit a model spec, evaluate on the hold-out set, and log to MLflow."""
-    pipeline = build_model_pipeline(spec.estimator)
-    search = GridSearchCV(
+    pipeline = build_model_pipeline(spec.estimator, memory=memory)
+    # Successive halving: every candidate starts on a small sample and only the best third
+    # advances to the next, larger round, instead of fitting the full grid on all rows.
+    search = HalvingGridSearchCV(
         estimator=pipeline,
         param_grid=spec.param_grid,
         cv=cv,
         scoring="roc_auc",
-        n_jobs=1,
+        factor=3,
+        resource="n_samples",
+        random_state=settings.random_seed,
+        # Parallelize across candidate fits; estimators stay at n_jobs=1 to avoid oversubscription.
+        n_jobs=-1,
         refit=True,
     )
     search.fit(X_train, y_train)
 
-    best_estimator = search.best_estimator_
-    y_pred = best_estimator.predict(X_test)
-    y_proba = best_estimator.predict_proba(X_test)[:, 1]
+    # The fit cache is a training-time detail; keep it out of the logged/exported model.
+    best_estimator = search.best_estimator_.set_params(memory=None)
+    # One forward pass: predict() is the argmax of predict_proba for these classifiers.
+    proba = best_estimator.predict_proba(X_test)
+    y_pred = best_estimator.classes_[proba.argmax(axis=1)]
+    y_proba = proba[:, 1]
 
     metrics, figures = evaluate_predictions(y_test, y_pred, y_proba)
     metrics["best_cv_score"] = float(search.best_score_)
@@ -142,39 +187,58 @@ def train_single_model(
         "quick_mode": quick,
     }
 
+    # Each figure is rendered once, to the local PNG that is later uploaded to MLflow.
+    local_plots, pending_plots = save_figures_locally(figures, spec.name, pool=render_pool)
+
     with start_run(run_name=spec.name) as run:
         log_params_and_metrics(search.best_params_, metrics)
         mlflow.log_dict(run_details, "run_details.json")
-        log_figures(figures, prefix=f"{spec.name}_")
+        if not pending_plots:
+            log_image_files(local_plots.values())
         mlflow.sklearn.log_model(best_estimator, artifact_path="model")
         run_id = run.info.run_id
 
-    local_plots = save_figures_locally(figures, spec.name)
     for fig in figures.values():
-        try:
-            import matplotlib.pyplot as plt
-
-            plt.close(fig)
-        except Exception:
-            pass
+        plt.close(fig)
+    # Catch figures created outside evaluate_predictions (e.g. by library internals).
+    plt.close("all")
 
     return {
         "name": spec.name,
         "estimator": best_estimator,
         "metrics": metrics,
+        "_score": _selection_score(metrics),
         "params": search.best_params_,
         "run_id": run_id,
         "plots": local_plots,
+        "pending_plots": pending_plots,
     }
 
 
+def finalize_plots(results: List[Dict[str, object]]) -> None:
+    """Wait for background-rendered plots and attach them to their (finished) MLflow runs."""
+    for res in results:
+        pending = res.get("pending_plots") or []
+        if not pending:
+            continue
+        for future in pending:
+            future.result()
+        log_image_files(res["plots"].values(), run_id=res["run_id"])
+        res["pending_plots"] = []
+
+
+def _selection_score(metrics: Dict[str, float]) -> Tuple[float, float]:
+    return (metrics.get("roc_auc", 0.0), metrics.get("accuracy", 0.0))
+
+
 def select_best_model(results: List[Dict[str, object]]) -> Dict[str, object]:
     """Pick the model with the highest ROC-AUC (tie-breaker: accuracy)."""
     def score_key(res):
-        metrics = res["metrics"]
-        return (metrics.get("roc_auc", 0.0), metrics.get("accuracy", 0.0))
+        score = res.get("_score")
+        return score if score is not None else _selection_score(res["metrics"])
 
-    return sorted(results, key=score_key)[-1]
+    # Single pass; scanning in reverse keeps the previous "last one wins" behaviour on full ties.
+    return max(reversed(results), key=score_key)
 
 
 def write_training_summary(results: List[Dict[str, object]]) -> Path:
@@ -183,6 +247,9 @@ def write_training_summary(results: List[Dict[str, object]]) -> Path:
     summary_path.parent.mkdir(parents=True, exist_ok=True)
     serializable = []
     for res in results:
+        # Plot files rendered in the background must exist before they are referenced.
+        for pending in res.get("pending_plots", []):
+            pending.result()
         serializable.append(
             {
                 "name": res["name"],
@@ -192,7 +259,7 @@ def write_training_summary(results: List[Dict[str, object]]) -> Path:
                 "plots": {k: str(v) for k, v in res.get("plots", {}).items()},
             }
         )
-    summary_path.write_text(json.dumps(serializable, indent=2))
+    summary_path.write_bytes(orjson.dumps(serializable, option=orjson.OPT_INDENT_2))
     return summary_path
 
 
@@ -206,28 +273,42 @@ def main() -> None:
 
     folds = 3 if args.quick else 5
     cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=settings.random_seed)
+    # Materialize the folds once so every spec reuses the same index arrays.
+    cv_splits = list(cv.split(X_train, y_train))
 
-    results: List[Dict[str, object]] = []
-    for spec in model_search_spaces(args.quick):
-        res = train_single_model(
-            spec=spec,
-            X_train=X_train,
-            y_train=y_train,
-            X_test=X_test,
-            y_test=y_test,
-            cv=cv,
-            data_source=data_source,
-            quick=args.quick,
-        )
-        results.append(res)
-        print(
-            f"[{spec.name}] test metrics "
-            + ", ".join(f"{k}={v:.3f}" for k, v in res["metrics"].items())
-        )
-
-    best = select_best_model(results)
-    export_path = export_model(best["estimator"], best["run_id"], best["name"])
-    summary_path = write_training_summary(results)
+    # PNG encoding overlaps with the next spec's grid search unless --singlecore is set.
+    render_pool = None if args.singlecore else ProcessPoolExecutor(max_workers=1)
+    # Shared preprocessor fit cache: grid candidates on the same fold skip refitting it.
+    memory = Memory(location=str(Path(settings.artifacts_dir) / "pipeline_cache"), verbose=0)
+    try:
+        results: List[Dict[str, object]] = []
+        for spec in model_search_spaces(args.quick):
+            res = train_single_model(
+                spec=spec,
+                X_train=X_train,
+                y_train=y_train,
+                X_test=X_test,
+                y_test=y_test,
+                cv=cv_splits,
+                data_source=data_source,
+                quick=args.quick,
+                render_pool=render_pool,
+                memory=memory,
+            )
+            results.append(res)
+            print(
+                f"[{spec.name}] test metrics "
+                + ", ".join(f"{k}={v:.3f}" for k, v in res["metrics"].items())
+            )
+
+        finalize_plots(results)
+        best = select_best_model(results)
+        export_path = export_model(best["estimator"], best["run_id"], best["name"])
+        summary_path = write_training_summary(results)
+    finally:
+        memory.clear(warn=False)
+        if render_pool is not None:
+            render_pool.shutdown()
 
     print(
         f"Best model: {best['name']} (run_id={best['run_id']}) "
@@ -1,6 +1,11 @@
+import asyncio
+
 from fastapi.testclient import TestClient
 
 from src.heart.api import main
+from src.heart.api.batching import MicroBatcher
+from src.heart.api.schema import PredictionRequest
+from src.heart.data import FEATURE_COLUMNS
 from src.heart.api.main import app
 
 
@@ -42,6 +47,55 @@ def test_predict_with_stub_model():
     main._set_model_state(model=None, model_version=None, run_id=None)  # type: ignore[attr-defined]
 
 
+def test_predict_falls_back_to_labels_without_predict_proba():
+    class _LabelOnlyModel:
+        def predict(self, df):
+            return [0]
+
+    main._set_model_state(model=_LabelOnlyModel(), model_version="v-test", run_id="run-123")  # type: ignore[attr-defined]
+    client = TestClient(app)
+    response = client.post("/predict", json=_sample_payload())
+    assert response.status_code == 200
+    body = response.json()
+    assert body["prediction"] == 0
+    assert body["probability"] == 0.0
+    main._set_model_state(model=None, model_version=None, run_id=None)  # type: ignore[attr-defined]
+
+
+def test_request_id_is_echoed_or_generated():
+    client = TestClient(app)
+    assert client.get("/health", headers={"X-Request-ID": "abc-123"}).headers["X-Request-ID"] == "abc-123"
+    generated = client.get("/health").headers["X-Request-ID"]
+    assert len(generated) == 16 and int(generated, 16) >= 0
+
+
+def test_predict_rejects_unknown_fields():
+    client = TestClient(app)
+    response = client.post("/predict", json={**_sample_payload(), "unexpected": 1})
+    assert response.status_code == 422
+
+
+def test_prediction_request_fields_match_feature_columns():
+    assert set(PredictionRequest.model_fields) == set(FEATURE_COLUMNS)
+
+
+def test_micro_batcher_groups_concurrent_submissions():
+    batch_sizes = []
+
+    def _handler(items):
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    async def _run():
+        batcher = MicroBatcher(_handler, max_batch_size=8, max_wait_seconds=0.05)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(_run()) == [0, 2, 4, 6, 8]
+    assert batch_sizes == [5]
+
+
 def test_metrics_endpoint():
     client = TestClient(app)
     response = client.get("/metrics")
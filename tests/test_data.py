@@ -30,3 +30,19 @@ def test_load_raw_missing_file_raises():
     except FileNotFoundError:
         return
     raise AssertionError("Expected FileNotFoundError for missing raw data")
+
+
+def test_load_processed_reads_parquet(tmp_path):
+    df = data.load_sample()
+    parquet_path = tmp_path / data.PROCESSED_FILENAME
+    df.to_parquet(parquet_path, engine="pyarrow", index=False)
+    loaded = data.load_processed(parquet_path)
+    assert len(loaded) == len(df)
+    assert list(loaded.columns) == data.FEATURE_COLUMNS + [data.TARGET_COLUMN]
+
+
+def test_prepare_heart_dataframe_downcasts_dtypes():
+    df = data.load_sample()
+    assert all(df[col].dtype == "int8" for col in data.CATEGORICAL_FEATURES)
+    assert all(df[col].dtype == "float32" for col in data.NUMERIC_FEATURES)
+    assert df[data.TARGET_COLUMN].dtype == "int8"
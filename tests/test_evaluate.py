@@ -0,0 +1,46 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from sklearn.metrics import (
+    accuracy_score,
+    confusion_matrix,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from src.heart import evaluate
+
+
+def test_classification_metrics_match_sklearn():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=200)
+    y_pred = rng.integers(0, 2, size=200)
+    y_proba = rng.random(200)
+
+    metrics = evaluate.compute_classification_metrics(y_true, y_pred, y_proba)
+    assert np.isclose(metrics["accuracy"], accuracy_score(y_true, y_pred))
+    assert np.isclose(metrics["precision"], precision_score(y_true, y_pred, zero_division=0))
+    assert np.isclose(metrics["recall"], recall_score(y_true, y_pred, zero_division=0))
+    assert (evaluate._confusion_counts(y_true, y_pred) == confusion_matrix(y_true, y_pred)).all()
+
+
+def test_classification_metrics_handle_no_positive_predictions():
+    y_true = np.array([0, 1, 1, 0])
+    y_pred = np.zeros(4, dtype=int)
+    metrics = evaluate.compute_classification_metrics(y_true, y_pred, np.full(4, 0.5))
+    assert metrics["precision"] == 0.0
+    assert metrics["recall"] == 0.0
+    assert metrics["accuracy"] == 0.5
+
+
+def test_evaluate_predictions_shares_roc_curve_with_auc():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, size=100)
+    y_proba = rng.random(100)
+    y_pred = (y_proba >= 0.5).astype(int)
+
+    metrics, figures = evaluate.evaluate_predictions(y_true, y_pred, y_proba)
+    assert np.isclose(metrics["roc_auc"], roc_auc_score(y_true, y_proba))
+    assert set(figures) == {"confusion_matrix", "roc_curve"}
+    for fig in figures.values():
+        plt.close(fig)
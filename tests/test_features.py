@@ -17,3 +17,11 @@ def test_feature_names_contains_expected_fields():
     assert "age" in names
     assert "thal" in names
     assert set(data.FEATURE_COLUMNS) == set(names)
+
+
+def test_preprocessor_keeps_float32_features():
+    df = data.load_sample()
+    X, _ = data.split_features_target(df)
+    assert all(X[col].dtype == "float32" for col in data.NUMERIC_FEATURES)
+    transformed = features.build_preprocessor().fit_transform(X)
+    assert transformed.dtype == "float32"
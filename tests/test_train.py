@@ -21,6 +21,7 @@ def test_quick_training_exports_model(tmp_path, monkeypatch):
     summary_path = settings.artifacts_dir / "training_summary.json"
 
     assert model_path.exists()
+    assert (settings.model_dir / "model.joblib").exists()
     assert metadata_path.exists()
     assert summary_path.exists()
 
@@ -28,3 +29,22 @@ def test_quick_training_exports_model(tmp_path, monkeypatch):
     assert "run_id" in metadata and metadata["run_id"]
     summary = json.loads(summary_path.read_text())
     assert isinstance(summary, list) and summary
+
+
+def test_export_model_replaces_previous_export(tmp_path, monkeypatch):
+    """Re-exporting swaps the model directory in place without leaving staging dirs."""
+    from sklearn.dummy import DummyClassifier
+
+    from src.heart.mlflow_utils import export_model
+
+    monkeypatch.setattr(settings, "model_dir", tmp_path / "model")
+    model = DummyClassifier().fit([[0], [1]], [0, 1])
+
+    export_model(model, "first", "dummy")
+    (settings.model_dir / "stale.txt").write_text("old export")
+    export_model(model, "second", "dummy")
+
+    metadata = json.loads((settings.model_dir / "metadata.json").read_text())
+    assert metadata["run_id"] == "second"
+    assert not (settings.model_dir / "stale.txt").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model"]